@@ -2,8 +2,11 @@ import sys
 import math
 import time
 import argparse
+from array import array
 from colorsys import hsv_to_rgb
 
+import numpy as np
+
 # Optional dependency for saving PNG screenshots
 try:
     from PIL import Image  # pyright: ignore[reportMissingImports]
@@ -11,6 +14,20 @@ try:
 except Exception:
     PIL_AVAILABLE = False
 
+# Separate guard: Pillow < 7.1 cannot import ImageGrab on Linux
+try:
+    from PIL import ImageGrab  # pyright: ignore[reportMissingImports]
+    GRAB_AVAILABLE = True
+except Exception:
+    GRAB_AVAILABLE = False
+
+# Optional dependency for a native per-frame coord transform
+try:
+    from numba import njit  # pyright: ignore[reportMissingImports]
+    NUMBA_AVAILABLE = True
+except Exception:
+    NUMBA_AVAILABLE = False
+
 try:
     import tkinter as tk
 except Exception:
@@ -24,31 +41,62 @@ VERSION = "1.2.0"
 DEFAULT_BG = "#111"
 DEFAULT_FPS = 60
 HELP_TEXT = "Space/Click: Pause | S: Screenshot | Esc: Exit"
+HUE_STEPS = 1024
+SIN_LUT_SIZE = 4096  # power of two so phases wrap with a bitmask
+_SIN_LUT = array('d', (
+    math.sin(2 * math.pi * i / SIN_LUT_SIZE) for i in range(SIN_LUT_SIZE)
+))
+HUE_LUT_RATE = 0.5 / (2 * math.pi) * SIN_LUT_SIZE  # LUT steps per second
 
 
 # =======================
 # Math helpers
 # =======================
 def make_heart_points(scale=10, steps=200):
-    pts = []
-    for i in range(steps):
-        t = (i / steps) * 2 * math.pi
-        x = 16 * (math.sin(t) ** 3)
-        y = (13 * math.cos(t)
-             - 5 * math.cos(2 * t)
-             - 2 * math.cos(3 * t)
-             - math.cos(4 * t))
-        pts.append((x * scale, -y * scale))
-    return pts
-
-
-def rgb_tuple_to_hex(rgb):
-    r, g, b = rgb
-    return '#{:02x}{:02x}{:02x}'.format(
-        int(r * 255), int(g * 255), int(b * 255)
+    """Return the heart outline as an (steps, 2) float64 array."""
+    t = np.linspace(0, 2 * np.pi, steps, endpoint=False)
+    x = 16 * np.sin(t) ** 3
+    y = (13 * np.cos(t)
+         - 5 * np.cos(2 * t)
+         - 2 * np.cos(3 * t)
+         - np.cos(4 * t))
+    return np.stack([x * scale, -y * scale], axis=1)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _fused_transform(bx, by, cx, cy, scale, out):
+        for i in range(bx.size):
+            out[2 * i] = cx + bx[i] * scale
+            out[2 * i + 1] = cy + by[i] * scale
+
+
+def _rgb_hex(r, g, b):
+    return '#%02x%02x%02x' % (int(r * 255), int(g * 255), int(b * 255))
+
+
+def _colors_for(bucket):
+    """Return (fill, glow) hex colors for a quantized hue bucket."""
+    h = bucket / HUE_STEPS
+    r, g, b = hsv_to_rgb(h, 0.85, 1.0)
+    gr = r + 0.35
+    gg = g + 0.35
+    gb = b + 0.35
+    return (
+        _rgb_hex(r, g, b),
+        _rgb_hex(gr if gr < 1.0 else 1.0,
+                 gg if gg < 1.0 else 1.0,
+                 gb if gb < 1.0 else 1.0),
     )
 
 
+# Fill/glow hex colors for every hue bucket, indexed per frame
+_COLORS = [_colors_for(i) for i in range(HUE_STEPS)]
+_HEX_TAB = [fill for fill, _ in _COLORS]
+_GLOW_TAB = [glow for _, glow in _COLORS]
+del _COLORS
+
+
 # =======================
 # GUI Application
 # =======================
@@ -70,7 +118,6 @@ class HeartApp:
         self.bg = bg
         self.pulse_period = pulse_period
         self.fps = fps
-        self.frame_delay = int(1000 / fps)
         self.glow_enabled = glow_enabled
 
         self.root = tk.Tk()
@@ -86,9 +133,19 @@ class HeartApp:
         self.canvas.pack(fill="both", expand=True)
 
         self.center = (self.width // 2, self.height // 2)
-        self.base_points = make_heart_points(scale=12, steps=300)
+        self.base_points = make_heart_points(
+            scale=12, steps=300).astype(np.float32)
+        if NUMBA_AVAILABLE:
+            # Split x/y columns so the Numba kernel makes one fused pass
+            self._bx = np.ascontiguousarray(self.base_points[:, 0])
+            self._by = np.ascontiguousarray(self.base_points[:, 1])
+            self._out = np.empty(2 * len(self.base_points), np.float32)
+        else:
+            self._out = np.empty_like(self.base_points)
+        # Largest vertex offset; bounds how far any point moves per pulse step
+        self._max_r = float(np.abs(self.base_points).max())
 
-        coords = self._translated_coords(self.base_points, 1.0)
+        coords = self._translated_coords(1.0)
         self.poly = self.canvas.create_polygon(
             coords, fill="#ff0066", outline="", smooth=True
         )
@@ -108,13 +165,24 @@ class HeartApp:
 
         self.running = True
         self.paused = False
+        self._visible = True
+        self._after_id = None
+        self._next_t = time.monotonic()
         self.hue_base = 0.0
 
+        # Last values pushed to the canvas; used to skip no-op Tcl calls
+        self._last_pulse = 1.0
+        self._last_fill = "#ff0066"
+        self._last_glow = ""
+
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         self.root.bind("<Escape>", lambda e: self._on_close())
         self.root.bind("<space>", lambda e: self.toggle_pause())
         self.root.bind("<Key-s>", lambda e: self.save_screenshot())
         self.canvas.bind("<Button-1>", lambda e: self.toggle_pause())
+        self.root.bind("<Unmap>", lambda e: self._set_visible(False))
+        self.root.bind("<Map>", lambda e: self._set_visible(True))
+        self.canvas.bind("<Visibility>", self._on_visibility)
 
     def _on_close(self):
         self.running = False
@@ -123,6 +191,22 @@ class HeartApp:
         except Exception:
             pass
 
+    def _on_visibility(self, event):
+        self._set_visible(event.state != "VisibilityFullyObscured")
+
+    def _set_visible(self, visible):
+        if visible == self._visible:
+            return
+        self._visible = visible
+        # The loop stops rescheduling itself while hidden; re-arm it here,
+        # unless a callback is still pending, so only one frame is queued
+        if visible and self.running and self._after_id is None:
+            self._next_t = time.monotonic()
+            self._update()
+
+    def _schedule(self, delay):
+        self._after_id = self.root.after(delay, self._update)
+
     def toggle_pause(self):
         self.paused = not self.paused
         self.canvas.itemconfig(
@@ -131,43 +215,103 @@ class HeartApp:
             if self.paused else HELP_TEXT
         )
 
-    def _translated_coords(self, points, scale):
+    def _translated_coords(self, scale):
         cx, cy = self.center
-        coords = []
-        for x, y in points:
-            coords.extend((cx + x * scale, cy + y * scale))
-        return coords
+        out = self._out
+        if NUMBA_AVAILABLE:
+            _fused_transform(self._bx, self._by, cx, cy, scale, out)
+        else:
+            np.multiply(self.base_points, scale, out=out)
+            out[:, 0] += cx
+            out[:, 1] += cy
+        # Whole pixels serialize to much shorter Tcl strings than floats;
+        # any on-screen canvas coordinate fits in int16
+        np.rint(out, out=out)
+        return out.astype(np.int16).ravel().tolist()
 
     def _update(self):
-        if self.paused:
-            if self.running:
-                self.root.after(200, self._update)
+        self._after_id = None
+        if not self.running or not self._visible:
             return
 
-        t = time.time()
-        pulse = 1.0 + 0.12 * math.sin(2 * math.pi * (t / self.pulse_period))
-        hue = (self.hue_base + 0.06 * math.sin(t * 0.5)) % 1.0
-
-        rgb = hsv_to_rgb(hue, 0.85, 1.0)
-        hex_color = rgb_tuple_to_hex(rgb)
-
-        coords = self._translated_coords(self.base_points, pulse)
-        self.canvas.coords(self.poly, *coords)
-        self.canvas.itemconfig(self.poly, fill=hex_color)
+        if self.paused:
+            self._next_t = time.monotonic()
+            self._schedule(200)
+            return
 
-        if self.glow_enabled and self.glow:
-            glow_rgb = tuple(min(1.0, c + 0.35) for c in rgb)
-            self.canvas.coords(self.glow, *coords)
-            self.canvas.itemconfig(self.glow, fill=rgb_tuple_to_hex(glow_rgb))
+        # Locals for names read more than once below
+        canvas = self.canvas
+        poly = self.poly
+        glow = self.glow if self.glow_enabled else None
+        lut = _SIN_LUT
+        mask = SIN_LUT_SIZE - 1
 
-        if self.running:
-            self.root.after(self.frame_delay, self._update)
+        t = time.time()
+        pulse = 1.0 + 0.12 * lut[
+            int(t / self.pulse_period * SIN_LUT_SIZE) & mask]
+        hue = (self.hue_base + 0.06 * lut[
+            int(t * HUE_LUT_RATE) & mask]) % 1.0
+
+        bucket = int(hue * HUE_STEPS) & (HUE_STEPS - 1)
+        hex_color = _HEX_TAB[bucket]
+        glow_color = _GLOW_TAB[bucket]
+
+        # Skip geometry when no vertex would move by half a pixel or more
+        if abs(pulse - self._last_pulse) * self._max_r >= 0.5:
+            coords = self._translated_coords(pulse)
+            canvas.coords(poly, coords)
+            if glow:
+                canvas.coords(glow, coords)
+            self._last_pulse = pulse
+
+        # fill is the only per-frame option; send it only when it changes
+        if hex_color != self._last_fill:
+            canvas.itemconfigure(poly, fill=hex_color)
+            self._last_fill = hex_color
+
+        if glow and glow_color != self._last_glow:
+            canvas.itemconfigure(glow, fill=glow_color)
+            self._last_glow = glow_color
+
+        # Drop missed frames instead of replaying them in a catch-up burst
+        now = time.monotonic()
+        frame = 1.0 / self.fps
+        if now > self._next_t + 2 * frame:
+            self._next_t = now + frame
+        else:
+            self._next_t += frame
+        self._schedule(max(1, int((self._next_t - now) * 1000)))
 
     def save_screenshot(self):
         ts = time.strftime("%Y%m%d_%H%M%S")
         base = f"animated_heart_{ts}"
         ps_file = base + ".ps"
 
+        if GRAB_AVAILABLE:
+            # Flush pending redraws so the grab sees the current frame
+            self.root.update_idletasks()
+            x = self.canvas.winfo_rootx()
+            y = self.canvas.winfo_rooty()
+            w = self.canvas.winfo_width()
+            h = self.canvas.winfo_height()
+            try:
+                img = ImageGrab.grab(bbox=(x, y, x + w, y + h))
+                # With display scaling on Windows, Pillow grabs physical
+                # pixels while Tk reports logical ones, so the region is off
+                if img.size != (w, h):
+                    raise ValueError(
+                        f"grabbed {img.size[0]}x{img.size[1]}, "
+                        f"expected {w}x{h}")
+                img.save(base + ".png", "PNG")
+                print(f"Saved screenshot: {base}.png")
+                return
+            except Exception as e:
+                # e.g. headless X11 without a grab backend, or a scaled
+                # display. The grab copies screen pixels, so anything
+                # covering the canvas ends up in it; the PostScript export
+                # below has no such limit.
+                print(f"Screen grab failed, using PostScript: {e}")
+
         try:
             self.canvas.postscript(file=ps_file, colormode="color")
         except Exception as e:
@@ -184,10 +328,43 @@ class HeartApp:
             print(f"Saved PostScript screenshot: {ps_file}")
 
     def run(self):
+        self._next_t = time.monotonic()
         self._update()
         self.root.mainloop()
 
 
+# =======================
+# ASCII Mode
+# =======================
+def ascii_heart_loop(width=40, height=24, pulse_period=1.2, fps=DEFAULT_FPS):
+    # Grid coordinates are fixed; only the pulse scale changes per frame
+    x0 = (np.arange(width) - width / 2) / (width / 4)
+    y0 = -(np.arange(height) - height / 2) / (height / 4) * 1.2
+    x0 = x0[None, :]
+    y0 = y0[:, None]
+    delay = 1.0 / fps
+
+    try:
+        while True:
+            t = time.time()
+            pulse = 1.0 + 0.12 * _SIN_LUT[
+                int(t / pulse_period * SIN_LUT_SIZE) & (SIN_LUT_SIZE - 1)]
+            x = x0 / pulse
+            y = y0 / pulse
+            xx = x * x
+            v = (xx + y * y - 1) ** 3 - xx * y ** 3
+            d = np.hypot(x, y)
+            ch = np.where(v > 0, ' ',
+                          np.where(d < 0.5, '@',
+                                   np.where(d < 0.9, 'O', '*')))
+            frame = '\n'.join(map(''.join, ch.tolist()))
+            sys.stdout.write("\033[H\033[J" + frame + "\n")
+            sys.stdout.flush()
+            time.sleep(delay)
+    except KeyboardInterrupt:
+        pass
+
+
 # =======================
 # CLI Entry
 # =======================
@@ -203,7 +380,7 @@ def main():
     args = parser.parse_args()
 
     if args.ascii:
-        print("ASCII mode unchanged.")
+        ascii_heart_loop(pulse_period=args.pulse, fps=args.fps)
         return
 
     if not tk: